@@ -1,5 +1,5 @@
 from __future__ import annotations
-import logging, asyncio, aiohttp, importlib
+import logging, asyncio, aiohttp, importlib, voluptuous as vol
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers import aiohttp_client
@@ -7,18 +7,29 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import (
-    DOMAIN, PLATFORMS, SERVICE_REFRESH,
+    DOMAIN, PLATFORMS, SERVICE_REFRESH, SERVICE_PROFILE,
+    ATTR_ENTRY_ID, ATTR_TICKS, ATTR_DURATION, DEFAULT_PROFILE_TICKS,
     CONF_HOST, CONF_USERNAME, CONF_PASSWORD,
     CONF_IGNORE_TLS_ERRORS, CONF_USE_HTTP,
     CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL,
     API_PATH
 )
+from .websocket_api import async_register_websocket_commands, async_remove_readings_fanout
+from .profiler import async_start_profiling
+from .aggregate import async_get_site_aggregator
 _LOGGER = logging.getLogger(__name__)
 
+PROFILE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_ENTRY_ID): str,
+    vol.Optional(ATTR_TICKS): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+    vol.Optional(ATTR_DURATION): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+})
+
 async def async_setup(hass: HomeAssistant, config: ConfigType):
     await hass.async_add_executor_job(
         importlib.import_module, f"{__name__}.sensor"
     )
+    async_register_websocket_commands(hass)
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -68,13 +79,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     await coord.async_request_refresh()
         hass.services.async_register(DOMAIN, SERVICE_REFRESH, _handle_refresh)
 
+    if not hass.services.has_service(DOMAIN, SERVICE_PROFILE):
+        async def _handle_profile(call: ServiceCall):
+            if ATTR_ENTRY_ID in call.data:
+                entry_ids = [call.data[ATTR_ENTRY_ID]]
+            else:
+                entry_ids = [eid for eid, ent_data in hass.data.get(DOMAIN, {}).items() if "coordinator" in ent_data]
+            ticks = call.data.get(ATTR_TICKS)
+            duration = call.data.get(ATTR_DURATION)
+            if not ticks and not duration:
+                ticks = DEFAULT_PROFILE_TICKS
+            async_start_profiling(hass, entry_ids, ticks, duration)
+        hass.services.async_register(DOMAIN, SERVICE_PROFILE, _handle_profile, schema=PROFILE_SCHEMA)
+
     return True
 
 async def _async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     await hass.config_entries.async_reload(entry.entry_id)
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    prof = hass.data[DOMAIN].get(entry.entry_id, {}).get("profiler")
+    if prof is not None:
+        prof.async_stop()
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
     return unload_ok
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    async_remove_readings_fanout(hass, entry.entry_id)
+    site = await async_get_site_aggregator(hass)
+    site.async_forget_entry(entry.entry_id)
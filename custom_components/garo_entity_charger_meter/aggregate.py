@@ -0,0 +1,193 @@
+"""Site-wide totals across all GARO chargers, maintained incrementally."""
+from __future__ import annotations
+import math
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DATA_SITE, SITE_REBUILD_EVERY, SITE_STORAGE_KEY, SITE_STORAGE_VERSION, SITE_SAVE_DELAY,
+)
+
+# Instantaneous readings summed across chargers; a missing reading counts as 0.
+FIELDS = ("power", "current_l1", "current_l2", "current_l3")
+_ZERO = (0.0,) * len(FIELDS)
+
+
+async def async_get_site_aggregator(hass: HomeAssistant) -> "SiteAggregator":
+    site = hass.data.get(DATA_SITE)
+    if site is None:
+        site = hass.data[DATA_SITE] = SiteAggregator(hass)
+        site.loaded = hass.async_create_task(site.async_load())
+    # Entries set up concurrently all wait for the same load.
+    await site.loaded
+    return site
+
+
+class SiteAggregator:
+    """Running sums over every charger's latest snapshot.
+
+    A snapshot update replaces that entry's contribution in place, so the cost
+    is independent of the number of chargers. Sums are rebuilt from the
+    contributions every SITE_REBUILD_EVERY updates to shed float drift.
+
+    Site energy is the sum of per-entry contributions, each accumulated from
+    the positive steps of that charger's register since it was added. When a
+    register goes backwards (meter reset or replacement) the baseline moves
+    to the new reading, so consumption after the reset counts straight away.
+    Contributions and baselines persist in .storage; they are kept while a
+    charger is offline or unloaded and dropped when its entry is deleted.
+
+    The site entities belong to whichever loaded entry registered first (the
+    owner); when the owner unloads they are recreated on another loaded entry.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self._hass = hass
+        self.loaded = None
+        self.owner: str | None = None
+        # entry_id -> async_add_entities of each loaded entry's sensor platform
+        self._platforms: dict = {}
+        self._create_entities = None
+        self._contrib: dict[str, tuple] = {}
+        self._totals = list(_ZERO)
+        # entry_id -> kWh accumulated for the site / last register reading
+        self._energy: dict[str, float] = {}
+        self._baseline: dict[str, float] = {}
+        self._energy_total = 0.0
+        self._generations: dict[str, int] = {}
+        self._updates = 0
+        self._listeners: list = []
+        self._store = Store(hass, SITE_STORAGE_VERSION, SITE_STORAGE_KEY)
+        self._save_scheduled = False
+
+    async def async_load(self) -> None:
+        stored = await self._store.async_load() or {}
+        for entry_id, item in stored.get("entries", {}).items():
+            self._energy[entry_id] = float(item["energy"])
+            if item.get("baseline") is not None:
+                self._baseline[entry_id] = float(item["baseline"])
+        self._energy_total = math.fsum(self._energy.values())
+
+    def _schedule_save(self) -> None:
+        # async_delay_save() restarts its timer on every call, which would
+        # postpone the write indefinitely with chargers updating every tick.
+        if not self._save_scheduled:
+            self._save_scheduled = True
+            self._store.async_delay_save(self._data_to_save, SITE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        self._save_scheduled = False
+        return {"entries": {
+            entry_id: {"energy": energy, "baseline": self._baseline.get(entry_id)}
+            for entry_id, energy in self._energy.items()
+        }}
+
+    def value(self, key: str):
+        if key == "energy":
+            return self._energy_total if self._energy else None
+        if not self._contrib:
+            return None
+        if key == "max_phase_current":
+            return max(self._totals[1:])
+        return self._totals[FIELDS.index(key)]
+
+    @callback
+    def async_update_entry(self, entry_id: str, snap) -> None:
+        if snap is None or self._generations.get(entry_id) == snap.fast_generation:
+            return
+        self._generations[entry_id] = snap.fast_generation
+        fast = snap.fast
+
+        new = tuple(fast.get(k) or 0.0 for k in FIELDS)
+        old = self._contrib.get(entry_id, _ZERO)
+        self._contrib[entry_id] = new
+        for i in range(len(FIELDS)):
+            self._totals[i] += new[i] - old[i]
+
+        # The entity's "energy" is held when the register goes backwards; the
+        # raw register is what shows a reset.
+        reading = fast.get("energy_register", fast.get("energy"))
+        if reading is not None:
+            self._async_update_energy(entry_id, reading)
+
+        self._updates += 1
+        if self._updates % SITE_REBUILD_EVERY == 0:
+            self._rebuild()
+        self._notify()
+
+    def _async_update_energy(self, entry_id: str, reading: float) -> None:
+        baseline = self._baseline.get(entry_id)
+        if baseline == reading:
+            return
+        self._baseline[entry_id] = reading
+        if baseline is None:
+            self._energy.setdefault(entry_id, 0.0)
+        elif reading > baseline:
+            self._energy[entry_id] = self._energy.get(entry_id, 0.0) + reading - baseline
+            self._energy_total += reading - baseline
+        self._schedule_save()
+
+    @callback
+    def async_remove_entry(self, entry_id: str) -> None:
+        """Drop an entry's instantaneous readings (unload); its energy stays."""
+        self._generations.pop(entry_id, None)
+        old = self._contrib.pop(entry_id, None)
+        if old is None:
+            return
+        for i in range(len(FIELDS)):
+            self._totals[i] -= old[i]
+        self._notify()
+
+    @callback
+    def async_forget_entry(self, entry_id: str) -> None:
+        """The entry was deleted: drop its energy contribution too.
+
+        The site energy sensor is TOTAL_INCREASING, so the drop is recorded
+        as a meter reset rather than negative consumption.
+        """
+        self.async_remove_entry(entry_id)
+        self._baseline.pop(entry_id, None)
+        if self._energy.pop(entry_id, None) is None:
+            return
+        self._energy_total = math.fsum(self._energy.values())
+        self._schedule_save()
+        self._notify()
+
+    @callback
+    def async_register_platform(self, entry_id: str, async_add_entities, create_entities) -> None:
+        self._platforms[entry_id] = async_add_entities
+        self._create_entities = create_entities
+        if self.owner is None:
+            self._async_take_ownership(entry_id)
+
+    @callback
+    def async_unregister_platform(self, entry_id: str) -> None:
+        """Called after the entry's platform (and the site entities, if owned) unloaded."""
+        self._platforms.pop(entry_id, None)
+        if self.owner != entry_id:
+            return
+        self.owner = None
+        if self._platforms and not self._hass.is_stopping:
+            self._async_take_ownership(next(iter(self._platforms)))
+
+    def _async_take_ownership(self, entry_id: str) -> None:
+        self.owner = entry_id
+        self._platforms[entry_id](self._create_entities())
+
+    def _rebuild(self) -> None:
+        self._totals = [math.fsum(c[i] for c in self._contrib.values()) for i in range(len(FIELDS))]
+        self._energy_total = math.fsum(self._energy.values())
+
+    @callback
+    def async_add_listener(self, update_callback):
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove():
+            self._listeners.remove(update_callback)
+        return _remove
+
+    def _notify(self) -> None:
+        for update_callback in list(self._listeners):
+            update_callback()
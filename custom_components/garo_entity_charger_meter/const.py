@@ -23,3 +23,52 @@ API_PATH = "/status/energy-meter"
 API_PATH_TEMPS = "/status/temperatures"
 
 REDACT_KEYS = {CONF_PASSWORD, CONF_USERNAME}
+
+# Share of the fast scan interval a single tick may spend fetching.
+TICK_BUDGET_FRACTION = 0.8
+# Below this many seconds of remaining budget, lower-priority fetches are deferred.
+TICK_MIN_FETCH_TIME = 1.0
+# How many ticks a deferred fast reading may be carried forward before it is dropped.
+TICK_MAX_CARRY_TICKS = 3
+# A diagnostics fetch deferred this many ticks may use the reserve beyond the
+# budget (at most one per tick).
+TICK_DIAG_STARVE_TICKS = 3
+
+# Endpoint priorities within a tick, lowest first.
+PRIORITY_ENERGY = 0
+PRIORITY_CHARGING_STATE = 1
+PRIORITY_PILOT = 2
+PRIORITY_DIAGNOSTICS = 3
+
+# Readings decoded from the energy-meter endpoint.
+ENERGY_METER_KEYS = (
+    "current_l1", "current_l2", "current_l3",
+    "voltage_l1", "voltage_l2", "voltage_l3",
+    "voltage_l1_l2", "voltage_l2_l3", "voltage_l3_l1",
+    "energy", "power",
+)
+
+WS_TYPE_SUBSCRIBE_READINGS = f"{DOMAIN}/subscribe_readings"
+# At most one message per subscriber per this many seconds; newer deltas are
+# merged (latest value per field) until the window closes.
+WS_MIN_SEND_INTERVAL = 0.5
+# hass.data key holding the per-entry ReadingsFanout objects (kept across reloads).
+DATA_FANOUTS = f"{DOMAIN}_fanouts"
+
+# hass.data key holding the cross-charger SiteAggregator.
+DATA_SITE = f"{DOMAIN}_site"
+# Recompute site sums from scratch every N incremental updates.
+SITE_REBUILD_EVERY = 1000
+SITE_DEVICE_NAME = "GARO Site"
+# Per-charger site energy contributions persist in .storage under this key.
+SITE_STORAGE_KEY = f"{DOMAIN}.site_energy"
+SITE_STORAGE_VERSION = 1
+SITE_SAVE_DELAY = 60
+
+SERVICE_PROFILE = "profile"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_TICKS = "ticks"
+ATTR_DURATION = "duration"
+DEFAULT_PROFILE_TICKS = 10
+# Profiles are written under the HA config directory.
+PROFILE_DIR = f"{DOMAIN}_profiles"
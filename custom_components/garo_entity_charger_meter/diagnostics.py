@@ -8,8 +8,16 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigE
     redacted = {}
     for k,v in entry.data.items():
         redacted[k] = "***" if k in REDACT_KEYS else v
+    ent_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    coord = ent_data.get("coordinator")
+    snap = coord.data if coord is not None else None
     return {
         "entry": redacted,
         "options": entry.options,
-        "has_coordinator": "coordinator" in hass.data.get(DOMAIN, {}).get(entry.entry_id, {}),
+        "has_coordinator": "coordinator" in ent_data,
+        "tick_stats": ent_data.get("tick_stats"),
+        "fast_generation": getattr(snap, "fast_generation", None),
+        "slow_generation": getattr(snap, "slow_generation", None),
+        "profiling": ent_data.get("profiler") is not None,
+        "last_profile": ent_data.get("last_profile"),
     }
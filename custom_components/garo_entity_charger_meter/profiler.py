@@ -0,0 +1,281 @@
+"""On-demand profiling of the coordinator update path.
+
+While a profile runs for an entry, its requests go through a dedicated
+session with aiohttp tracing, and each tick records time per phase:
+
+- connect: DNS lookup, plus the socket connect for plain HTTP
+- tls: socket connect plus TLS handshake (HTTPS only)
+- transfer: sending the request and reading the full response
+- decode: JSON decoding
+- parse: the rest of each fetch, i.e. pulling values out of the payload
+- state_write: the coordinator's listener fan-out (entity state writes,
+  site totals, websocket deltas)
+
+A request that times out or fails still books its time: whatever part of
+DNS, connect or TLS it got through, and the rest up to the failure as
+transfer.
+
+With profiling off, the update path only checks prof.enabled once per
+request, per decode and per fetch; the listener fan-out is wrapped only
+while a profile runs.
+"""
+from __future__ import annotations
+import asyncio, json, logging, os, time
+from collections import defaultdict
+import aiohttp
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import aiohttp_client
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, CONF_IGNORE_TLS_ERRORS, PROFILE_DIR
+
+_LOGGER = logging.getLogger(__name__)
+
+PHASES = ("connect", "tls", "transfer", "decode", "parse", "state_write")
+
+class _NullProfiler:
+    enabled = False
+
+    def begin_tick(self):
+        pass
+
+    def end_tick(self):
+        pass
+
+
+NULL_PROFILER = _NullProfiler()
+
+
+class UpdateProfiler:
+    """Collects a per-tick phase breakdown for one entry until N ticks or T seconds."""
+
+    enabled = True
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, ent_data: dict, ticks: int | None, duration: int | None):
+        self._hass = hass
+        self._entry_id = entry_id
+        self._ent_data = ent_data
+        self._max_ticks = ticks
+        self._duration = duration
+        self._ticks: list[dict] = []
+        self._current: dict | None = None
+        self._tick_started = 0.0
+        self._started = dt_util.utcnow()
+        self._cancel_timer = None
+        self._in_tick = False
+        self._expired = False
+        self._done = False
+        self._https = not ent_data.get("use_http")
+
+        trace = aiohttp.TraceConfig()
+        trace.on_connection_create_start.append(self._on_connection_create_start)
+        trace.on_connection_create_end.append(self._on_connection_create_end)
+        trace.on_dns_resolvehost_start.append(self._on_dns_start)
+        trace.on_dns_resolvehost_end.append(self._on_dns_end)
+        self.session = aiohttp_client.async_create_clientsession(
+            hass,
+            verify_ssl=not ent_data.get(CONF_IGNORE_TLS_ERRORS),
+            trace_configs=[trace],
+        )
+
+    @callback
+    def async_start(self) -> None:
+        self._ent_data["profiler"] = self
+        # Shadow the coordinator's listener fan-out on the instance for the
+        # length of the profile; _finish() removes it again.
+        coordinator = self._ent_data["coordinator"]
+        update_listeners = coordinator.async_update_listeners
+
+        @callback
+        def _profiled_update_listeners() -> None:
+            started = time.perf_counter()
+            try:
+                update_listeners()
+            finally:
+                self.add("update_listeners", "state_write", time.perf_counter() - started)
+
+        coordinator.async_update_listeners = _profiled_update_listeners
+        if self._duration:
+            self._cancel_timer = async_call_later(self._hass, self._duration, self._async_timer_done)
+        _LOGGER.info(
+            "Profiling %s for %s ticks / %s s", self._entry_id, self._max_ticks or "-", self._duration or "-",
+        )
+
+    # --- aiohttp trace hooks; they stamp the timings dict request() passes
+    # as trace_request_ctx, so a request that never gets past a phase still
+    # has its start time ---
+
+    async def _on_dns_start(self, session, ctx, params):
+        ctx.trace_request_ctx["dns_start"] = time.perf_counter()
+
+    async def _on_dns_end(self, session, ctx, params):
+        ctx.trace_request_ctx["dns_end"] = time.perf_counter()
+
+    async def _on_connection_create_start(self, session, ctx, params):
+        ctx.trace_request_ctx["create_start"] = time.perf_counter()
+
+    async def _on_connection_create_end(self, session, ctx, params):
+        ctx.trace_request_ctx["create_end"] = time.perf_counter()
+
+    async def request(self, endpoint, url, timeout, auth):
+        timings: dict = {}
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(timeout):
+                async with self.session.get(url, auth=auth, trace_request_ctx=timings) as resp:
+                    return resp.status, await resp.read()
+        finally:
+            ended = time.perf_counter()
+            connect = tls = 0.0
+            if "create_start" in timings:
+                # Connection creation includes the DNS lookup; split it back
+                # out. A phase cut short by a failure ends at the failure.
+                create_end = timings.get("create_end", ended)
+                dns = 0.0
+                if "dns_start" in timings:
+                    dns = timings.get("dns_end", create_end) - timings["dns_start"]
+                socket = create_end - timings["create_start"] - dns
+                connect = dns + (0.0 if self._https else socket)
+                tls = socket if self._https else 0.0
+            self.add(endpoint, "connect", connect)
+            self.add(endpoint, "tls", tls)
+            self.add(endpoint, "transfer", max(0.0, ended - started - connect - tls))
+
+    # --- tick bookkeeping ---
+
+    def begin_tick(self):
+        self._current = {"phases": defaultdict(float), "endpoints": defaultdict(lambda: defaultdict(float))}
+        self._tick_started = time.perf_counter()
+        self._in_tick = True
+
+    def end_tick(self):
+        if self._current is None:
+            return
+        self._in_tick = False
+        self._current["duration"] = time.perf_counter() - self._tick_started
+        self._ticks.append(self._current)
+        if self._expired or (self._max_ticks and len(self._ticks) >= self._max_ticks):
+            # Let the coordinator notify its entities first so their state
+            # writes land in this tick.
+            self._hass.loop.call_soon(self._finish)
+
+    def add(self, endpoint, name, seconds):
+        cur = self._current
+        if cur is None:
+            return
+        cur["phases"][name] += seconds
+        cur["endpoints"][endpoint][name] += seconds
+
+    def timed(self, endpoint, name, func, *args):
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.add(endpoint, name, time.perf_counter() - started)
+
+    async def timed_fetch(self, endpoint, fetch, out, timeout):
+        """Run a fetch; whatever request() and decode did not account for is parse.
+
+        request() books its time even when it fails, so a timeout shows up as
+        network time rather than parse.
+        """
+        cur = self._current
+        before = sum(cur["endpoints"][endpoint].values()) if cur is not None else 0.0
+        started = time.perf_counter()
+        try:
+            await fetch(out, timeout)
+        finally:
+            elapsed = time.perf_counter() - started
+            cur = self._current
+            if cur is not None:
+                accounted = sum(cur["endpoints"][endpoint].values()) - before
+                self.add(endpoint, "parse", max(0.0, elapsed - accounted))
+
+    # --- completion ---
+
+    @callback
+    def _async_timer_done(self, _now) -> None:
+        self._cancel_timer = None
+        # A tick in flight is still using the profiling session; end_tick()
+        # finishes once it completes.
+        self._expired = True
+        if not self._in_tick:
+            self._finish()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop early (entry unloading) and write what was collected."""
+        self._finish()
+
+    @callback
+    def _finish(self) -> None:
+        if self._done:
+            return
+        self._done = True
+        self.enabled = False
+        self._ent_data["coordinator"].__dict__.pop("async_update_listeners", None)
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+        if self._ent_data.get("profiler") is self:
+            self._ent_data["profiler"] = None
+        self._hass.async_create_task(self._async_write_report())
+
+    def _report(self) -> dict:
+        def _round(phases):
+            return {p: round(phases.get(p, 0.0), 6) for p in PHASES}
+
+        totals: dict = defaultdict(float)
+        ticks = []
+        for tick in self._ticks:
+            for p, v in tick["phases"].items():
+                totals[p] += v
+            ticks.append({
+                "duration": round(tick["duration"], 6),
+                "phases": _round(tick["phases"]),
+                "endpoints": {ep: _round(ph) for ep, ph in tick["endpoints"].items()},
+            })
+        count = len(ticks) or 1
+        return {
+            "entry_id": self._entry_id,
+            "started": self._started.isoformat(),
+            "finished": dt_util.utcnow().isoformat(),
+            "ticks": len(ticks),
+            "phase_totals": _round(totals),
+            "phase_avg_per_tick": {p: round(totals.get(p, 0.0) / count, 6) for p in PHASES},
+            "tick_breakdown": ticks,
+        }
+
+    async def _async_write_report(self) -> None:
+        await self.session.close()
+        report = self._report()
+        stamp = self._started.strftime("%Y%m%dT%H%M%S")
+        path = self._hass.config.path(PROFILE_DIR, f"{self._entry_id}_{stamp}.json")
+
+        def _write():
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as fh:
+                json.dump(report, fh, indent=2)
+
+        try:
+            await self._hass.async_add_executor_job(_write)
+        except OSError as e:
+            _LOGGER.warning("Could not write profile to %s: %s", path, e)
+            path = None
+        self._ent_data["last_profile"] = {"path": path, **report}
+        _LOGGER.info("Profile for %s finished after %d ticks, written to %s", self._entry_id, report["ticks"], path)
+
+
+@callback
+def async_start_profiling(hass: HomeAssistant, entry_ids, ticks: int | None, duration: int | None) -> None:
+    domain_data = hass.data.get(DOMAIN, {})
+    for entry_id in entry_ids:
+        ent_data = domain_data.get(entry_id)
+        if not isinstance(ent_data, dict) or "coordinator" not in ent_data:
+            _LOGGER.warning("Cannot profile %s: entry not loaded", entry_id)
+            continue
+        if ent_data.get("profiler") is not None:
+            _LOGGER.warning("Profiling already running for %s", entry_id)
+            continue
+        UpdateProfiler(hass, entry_id, ent_data, ticks, duration).async_start()
@@ -1,8 +1,8 @@
 from __future__ import annotations
-import logging, asyncio, aiohttp
+import logging, asyncio, aiohttp, json
 from datetime import timedelta
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, CoordinatorEntity
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers import aiohttp_client, device_registry as dr
@@ -11,14 +11,22 @@ from homeassistant.const import (
     UnitOfElectricCurrent, UnitOfElectricPotential, UnitOfPower, UnitOfEnergy, UnitOfTemperature
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from types import MappingProxyType
 
 from .const import (
     DOMAIN, CONF_HOST, CONF_USERNAME, CONF_PASSWORD,
     CONF_SCAN_INTERVAL, CONF_SLOW_SCAN_INTERVAL,
     CONF_IGNORE_TLS_ERRORS, CONF_ENABLE_PHASE_SENSORS,
     CONF_ENABLE_LINE_VOLTAGES, CONF_USE_HTTP, MANUFACTURER, PRODUCT_NAME,
-    API_PATH, DEFAULT_SCAN_INTERVAL, DEFAULT_SLOW_SCAN_INTERVAL
+    API_PATH, DEFAULT_SCAN_INTERVAL, DEFAULT_SLOW_SCAN_INTERVAL,
+    TICK_BUDGET_FRACTION, TICK_MIN_FETCH_TIME, TICK_MAX_CARRY_TICKS, TICK_DIAG_STARVE_TICKS,
+    PRIORITY_ENERGY, PRIORITY_CHARGING_STATE, PRIORITY_PILOT, PRIORITY_DIAGNOSTICS,
+    ENERGY_METER_KEYS, SITE_DEVICE_NAME,
 )
+from .snapshot import GaroSnapshot, EMPTY_SECTION
+from .aggregate import async_get_site_aggregator
+from .profiler import NULL_PROFILER
+from .websocket_api import async_get_readings_fanout
 
 try:
     from .const import CONF_AUTH_SCHEME  # optional extension
@@ -40,6 +48,15 @@ API_PATH_PLC_STATUS = "/plc/device-status"
 
 _LOGGER = logging.getLogger(__name__)
 
+def _decode_json(body: bytes):
+    """Decode like resp.json(content_type=None): an empty body gives None."""
+    if not body.strip():
+        return None
+    return json.loads(body)
+
+def _text(body: bytes) -> str:
+    return body.decode("utf-8", errors="replace")
+
 SENSOR_MAP = {
     "current_l1": {"name":"Charger L1 Current","device_class":SensorDeviceClass.CURRENT,"unit":UnitOfElectricCurrent.AMPERE,"state_class":SensorStateClass.MEASUREMENT},
     "current_l2": {"name":"Charger L2 Current","device_class":SensorDeviceClass.CURRENT,"unit":UnitOfElectricCurrent.AMPERE,"state_class":SensorStateClass.MEASUREMENT},
@@ -74,6 +91,15 @@ SENSOR_MAP = {
     "plc_zero_cross": {"name":"PLC Zero Cross","device_class":None,"unit":None,"state_class":None,"entity_category":EntityCategory.DIAGNOSTIC,"enabled_default":False},
 }
 
+SITE_SENSOR_MAP = {
+    "power": {"name":"Total Active Power","device_class":SensorDeviceClass.POWER,"unit":UnitOfPower.WATT,"state_class":SensorStateClass.MEASUREMENT},
+    "energy": {"name":"Total Imported Energy","device_class":SensorDeviceClass.ENERGY,"unit":UnitOfEnergy.KILO_WATT_HOUR,"state_class":SensorStateClass.TOTAL_INCREASING},
+    "current_l1": {"name":"Total L1 Current","device_class":SensorDeviceClass.CURRENT,"unit":UnitOfElectricCurrent.AMPERE,"state_class":SensorStateClass.MEASUREMENT},
+    "current_l2": {"name":"Total L2 Current","device_class":SensorDeviceClass.CURRENT,"unit":UnitOfElectricCurrent.AMPERE,"state_class":SensorStateClass.MEASUREMENT},
+    "current_l3": {"name":"Total L3 Current","device_class":SensorDeviceClass.CURRENT,"unit":UnitOfElectricCurrent.AMPERE,"state_class":SensorStateClass.MEASUREMENT},
+    "max_phase_current": {"name":"Max Phase Load","device_class":SensorDeviceClass.CURRENT,"unit":UnitOfElectricCurrent.AMPERE,"state_class":SensorStateClass.MEASUREMENT},
+}
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback):
     data = hass.data[DOMAIN][entry.entry_id]
 
@@ -126,301 +152,375 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         "Poll intervals: fast=%ds slow=%ds (slow fires every %d fast ticks)",
         scan_interval, slow_scan_interval, _slow_modulo,
     )
+    # Slow fetches write into _slow_cache; it is frozen into a new shared
+    # section (and the slow generation bumped) only when its contents change.
     _slow_cache: dict = {}
+    _slow_section = [EMPTY_SECTION]
+    _slow_generation = [0]
     _slow_counter = [_slow_modulo - 1]
-
-    async def _async_update_data():
-        _slow_counter[0] += 1
-        if _slow_counter[0] >= _slow_modulo:
-            _slow_counter[0] = 0
-            _LOGGER.debug("Running slow fetch (every %d ticks)", _slow_modulo)
-
-            # --- Temperature metrics ---
-            try:
-                async with asyncio.timeout(10):
-                    async with session.get(temp_url, auth=aiohttp.BasicAuth(username, password)) as resp:
-                        t_text = await resp.text()
-                        if resp.status == 200:
-                            try:
-                                temps = await resp.json(content_type=None)
-                            except Exception:
-                                _LOGGER.warning("Temp JSON decode failed URL=%s Raw=%s", temp_url, t_text[:120])
-                            else:
-                                _LOGGER.debug("Temperatures raw=%r", temps)
-                                if isinstance(temps, dict):
-                                    cpu = temps.get("cpu")
-                                    board = (
-                                        temps.get("base_board")
-                                        or temps.get("board")
-                                        or temps.get("baseboard")
-                                        or temps.get("pcb")
-                                        or temps.get("ambient")
-                                    )
-                                    if isinstance(cpu, (int, float)):
-                                        _slow_cache["cpu_temperature"] = float(cpu)
-                                    if isinstance(board, (int, float)):
-                                        _slow_cache["board_temperature"] = float(board)
-                        else:
-                            _LOGGER.debug("Temp endpoint status %s body=%s", resp.status, t_text[:120])
-            except Exception as e:
-                _LOGGER.debug("Temperature update failed: %s", e)
-
-            # --- Firmware version, device ID, unit ID ---
-            for label, url, key in (
-                ("firmware_version", firmware_url, "firmware_version"),
-                ("device_id", device_id_url, "device_id"),
-                ("unit_id", unit_id_url, "unit_id"),
-            ):
-                try:
-                    async with asyncio.timeout(10):
-                        async with session.get(url, auth=aiohttp.BasicAuth(username, password)) as resp:
-                            if resp.status == 200:
-                                try:
-                                    raw = await resp.json(content_type=None)
-                                except Exception:
-                                    raw = await resp.text()
-                                val = _extract_simple(raw)
-                                if val is not None:
-                                    _slow_cache[key] = str(val)
-                            else:
-                                _LOGGER.debug("%s endpoint status %s", label, resp.status)
-                except Exception as e:
-                    _LOGGER.debug("%s fetch failed: %s", label, e)
-
-            # --- Network interface ---
-            try:
-                async with asyncio.timeout(10):
-                    async with session.get(network_interface_url, auth=aiohttp.BasicAuth(username, password)) as resp:
-                        if resp.status == 200:
-                            try:
-                                raw = await resp.json(content_type=None)
-                            except Exception:
-                                raw = await resp.text()
-                            val = _extract_simple(raw)
-                            _LOGGER.debug("network_interface=%r (raw=%r)", val, raw)
-                            if val is not None:
-                                _slow_cache["network_interface"] = str(val)
-                        else:
-                            _LOGGER.debug("network_interface endpoint status %s", resp.status)
-            except Exception as e:
-                _LOGGER.debug("network_interface fetch failed: %s", e)
-
-            # --- Connection status ---
+    # Slow fetches that are due but have not had a slot yet.
+    _slow_pending: list[str] = []
+    # Fetch name -> consecutive ticks it has been deferred. Within a priority
+    # class carried-over fetches run first, oldest first, so the tail of the
+    # class rotates instead of starving. Diagnostics that keep losing get one
+    # slot per tick from the reserve left between the budget and the interval.
+    _carried: dict[str, int] = {}
+
+    # Each tick must finish well inside the scan interval, otherwise the
+    # coordinator falls behind and the energy reading loses its cadence.
+    tick_budget = scan_interval * TICK_BUDGET_FRACTION
+    tick_reserve = scan_interval - tick_budget
+    tick_stats = data["tick_stats"] = {
+        "budget": tick_budget,
+        "ticks": 0,
+        "overruns": 0,
+        "deferred": 0,
+        "last_duration": None,
+        "last_deferred": [],
+    }
+
+    # Profiler for the tick in progress; NULL_PROFILER unless the profile
+    # service switched it on for this entry.
+    _prof = [NULL_PROFILER]
+    auth = aiohttp.BasicAuth(username, password)
+
+    async def _request(label, url, timeout):
+        """GET url and read the whole body; returns (status, body bytes)."""
+        prof = _prof[0]
+        if prof.enabled:
+            return await prof.request(label, url, timeout, auth)
+        async with asyncio.timeout(timeout):
+            async with session.get(url, auth=auth) as resp:
+                return resp.status, await resp.read()
+
+    def _decode(label, body):
+        prof = _prof[0]
+        if prof.enabled:
+            return prof.timed(label, "decode", _decode_json, body)
+        return _decode_json(body)
+
+    # --- Fast endpoints ---
+
+    async def _fetch_energy(out, timeout):
+        try:
+            status, body = await _request("energy", base_url, timeout)
+            if status != 200:
+                _LOGGER.warning("Status %s energy URL=%s body=%s", status, base_url, _text(body)[:160])
+                return
             try:
-                async with asyncio.timeout(10):
-                    async with session.get(connection_status_url, auth=aiohttp.BasicAuth(username, password)) as resp:
-                        if resp.status == 200:
-                            try:
-                                raw = await resp.json(content_type=None)
-                            except Exception:
-                                _LOGGER.debug("connection_status JSON decode failed")
-                            else:
-                                _LOGGER.debug("connection_status raw=%r", raw)
-                                if isinstance(raw, dict):
-                                    for key in ("ip_address", "ip", "address", "ipv4"):
-                                        if key in raw:
-                                            _slow_cache["ip_address"] = str(raw[key])
-                                            break
-                                    for key in ("ssid", "SSID", "wifi_ssid"):
-                                        if key in raw:
-                                            _slow_cache["wifi_ssid"] = str(raw[key])
-                                            break
-                                    for key in ("rssi", "RSSI", "signal", "signal_strength", "signal_level"):
-                                        if key in raw:
-                                            try:
-                                                _slow_cache["wifi_signal"] = float(raw[key])
-                                            except (ValueError, TypeError):
-                                                pass
-                                            break
-                        else:
-                            _LOGGER.debug("connection_status endpoint status %s", resp.status)
-            except Exception as e:
-                _LOGGER.debug("connection_status fetch failed: %s", e)
+                payload = _decode("energy", body)
+            except ValueError:
+                _LOGGER.error("JSON decode failed energy URL=%s Raw=%s", base_url, _text(body)[:160])
+                return
+            for block in payload:
+                for sv in block.get("sampledValue", []):
+                    meas = sv.get("measurand")
+                    phase = sv.get("phase")
+                    raw = sv.get("value")
+                    if raw is None:
+                        continue
+                    try:
+                        val = float(raw)
+                    except (ValueError, TypeError):
+                        continue
+                    if meas == "Current.Import":
+                        if phase == "L1": out["current_l1"] = val
+                        elif phase == "L2": out["current_l2"] = val
+                        elif phase == "L3": out["current_l3"] = val
+                    elif meas == "Voltage":
+                        if phase == "L1-N": out["voltage_l1"] = val
+                        elif phase == "L2-N": out["voltage_l2"] = val
+                        elif phase == "L3-N": out["voltage_l3"] = val
+                        elif phase == "L1-L2": out["voltage_l1_l2"] = val
+                        elif phase == "L2-L3": out["voltage_l2_l3"] = val
+                        elif phase == "L3-L1": out["voltage_l3_l1"] = val
+                    elif meas == "Energy.Active.Import.Register":
+                        kwh = val / 1000.0
+                        # Unclamped register for the site total, which
+                        # rebases on a reset instead of holding the value.
+                        out["energy_register"] = kwh
+                        prev = coordinator.data.get("energy") if coordinator.data is not None else None
+                        if prev is not None and kwh < prev:
+                            _LOGGER.warning("Energy counter decreased (%.3f -> %.3f), keeping previous", prev, kwh)
+                            kwh = prev
+                        out["energy"] = kwh
+                    elif meas == "Power.Active.Import":
+                        out["power"] = val
+        except Exception as e:
+            _LOGGER.warning("Energy update failed: %s", e)
 
-            # --- SIM card info ---
+    async def _fetch_charging_state(out, timeout):
+        try:
+            status, body = await _request("charging_state", charging_state_url, timeout)
+            if status != 200:
+                _LOGGER.debug("charging_state endpoint status %s", status)
+                return
             try:
-                async with asyncio.timeout(10):
-                    async with session.get(sim_info_url, auth=aiohttp.BasicAuth(username, password)) as resp:
-                        if resp.status == 200:
-                            try:
-                                raw = await resp.json(content_type=None)
-                            except Exception:
-                                _LOGGER.debug("sim_info JSON decode failed")
-                            else:
-                                _LOGGER.debug("sim_info raw=%r", raw)
-                                if isinstance(raw, dict):
-                                    for k in ("iccid", "ICCID"):
-                                        if k in raw:
-                                            _slow_cache["sim_iccid"] = str(raw[k])
-                                            break
-                                    for k in ("operator", "carrier", "network", "plmn"):
-                                        if k in raw:
-                                            _slow_cache["sim_operator"] = str(raw[k])
-                                            break
-                        else:
-                            _LOGGER.debug("sim_info endpoint status %s", resp.status)
-            except Exception as e:
-                _LOGGER.debug("sim_info fetch failed: %s", e)
+                raw = _decode("charging_state", body)
+            except ValueError:
+                raw = _text(body)
+            val = _extract_simple(raw)
+            if val is not None:
+                out["charging_state"] = str(val)
+                _LOGGER.debug("charging_state=%s (raw=%r)", val, raw)
+        except Exception as e:
+            _LOGGER.debug("charging_state fetch failed: %s", e)
 
-            # --- PLC device status ---
+    def _make_level_fetch(label, url):
+        """Fetch a single float reading (CP/PP pilot levels) into out[label]."""
+        async def _fetch(out, timeout):
             try:
-                async with asyncio.timeout(10):
-                    async with session.get(plc_status_url, auth=aiohttp.BasicAuth(username, password)) as resp:
-                        if resp.status == 200:
-                            try:
-                                raw = await resp.json(content_type=None)
-                            except Exception:
-                                _LOGGER.debug("plc_device_status JSON decode failed")
-                            else:
-                                _LOGGER.debug("plc_device_status raw=%r", raw)
-                                if isinstance(raw, dict):
-                                    if "firmware_version" in raw:
-                                        _slow_cache["plc_firmware_version"] = str(raw["firmware_version"])
-                                    if "zero_cross" in raw:
-                                        _slow_cache["plc_zero_cross"] = str(raw["zero_cross"])
-                        else:
-                            _LOGGER.debug("plc_device_status endpoint status %s", resp.status)
+                status, body = await _request(label, url, timeout)
+                if status != 200:
+                    _LOGGER.debug("%s endpoint status %s", label, status)
+                    return
+                try:
+                    raw = _decode(label, body)
+                except ValueError:
+                    _LOGGER.debug("%s JSON decode failed", label)
+                    return
+                val = _extract_simple(raw)
+                _LOGGER.debug("%s=%r (raw=%r)", label, val, raw)
+                try:
+                    out[label] = float(val)
+                except (ValueError, TypeError):
+                    _LOGGER.debug("%s unexpected value: %r", label, val)
             except Exception as e:
-                _LOGGER.debug("plc_device_status fetch failed: %s", e)
+                _LOGGER.debug("%s fetch failed: %s", label, e)
+        return _fetch
 
-        # Merge last-known slow data, then overlay with fresh fast data
-        result = dict(_slow_cache)
+    # --- Slow endpoints ---
 
-        # --- Energy / electrical metrics ---
+    async def _fetch_temperatures(out, timeout):
         try:
-            async with asyncio.timeout(15):
-                async with session.get(base_url, auth=aiohttp.BasicAuth(username, password)) as resp:
-                    text = await resp.text()
-                    if resp.status != 200:
-                        _LOGGER.warning("Status %s energy URL=%s body=%s", resp.status, base_url, text[:160])
-                    else:
-                        try:
-                            payload = await resp.json(content_type=None)
-                        except Exception:
-                            _LOGGER.error("JSON decode failed energy URL=%s Raw=%s", base_url, text[:160])
-                        else:
-                            for block in payload:
-                                for sv in block.get("sampledValue", []):
-                                    meas = sv.get("measurand")
-                                    phase = sv.get("phase")
-                                    raw = sv.get("value")
-                                    if raw is None:
-                                        continue
-                                    try:
-                                        val = float(raw)
-                                    except (ValueError, TypeError):
-                                        continue
-                                    if meas == "Current.Import":
-                                        if phase == "L1": result["current_l1"] = val
-                                        elif phase == "L2": result["current_l2"] = val
-                                        elif phase == "L3": result["current_l3"] = val
-                                    elif meas == "Voltage":
-                                        if phase == "L1-N": result["voltage_l1"] = val
-                                        elif phase == "L2-N": result["voltage_l2"] = val
-                                        elif phase == "L3-N": result["voltage_l3"] = val
-                                        elif phase == "L1-L2": result["voltage_l1_l2"] = val
-                                        elif phase == "L2-L3": result["voltage_l2_l3"] = val
-                                        elif phase == "L3-L1": result["voltage_l3_l1"] = val
-                                    elif meas == "Energy.Active.Import.Register":
-                                        kwh = val / 1000.0
-                                        prev = (coordinator.data or {}).get("energy")
-                                        if prev is not None and kwh < prev:
-                                            _LOGGER.warning("Energy counter decreased (%.3f -> %.3f), keeping previous", prev, kwh)
-                                            kwh = prev
-                                        result["energy"] = kwh
-                                    elif meas == "Power.Active.Import":
-                                        result["power"] = val
+            status, body = await _request("temperatures", temp_url, timeout)
+            if status != 200:
+                _LOGGER.debug("Temp endpoint status %s body=%s", status, _text(body)[:120])
+                return
+            try:
+                temps = _decode("temperatures", body)
+            except ValueError:
+                _LOGGER.warning("Temp JSON decode failed URL=%s Raw=%s", temp_url, _text(body)[:120])
+                return
+            _LOGGER.debug("Temperatures raw=%r", temps)
+            if isinstance(temps, dict):
+                cpu = temps.get("cpu")
+                board = (
+                    temps.get("base_board")
+                    or temps.get("board")
+                    or temps.get("baseboard")
+                    or temps.get("pcb")
+                    or temps.get("ambient")
+                )
+                if isinstance(cpu, (int, float)):
+                    out["cpu_temperature"] = float(cpu)
+                if isinstance(board, (int, float)):
+                    out["board_temperature"] = float(board)
         except Exception as e:
-            _LOGGER.warning("Energy update failed: %s", e)
+            _LOGGER.debug("Temperature update failed: %s", e)
 
-        # Derived metrics
-        if all(k in result for k in ("current_l1", "current_l2", "current_l3")):
-            result["current_total"] = result["current_l1"] + result["current_l2"] + result["current_l3"]
-        if all(k in result for k in ("voltage_l1", "voltage_l2", "voltage_l3")):
-            result["voltage_avg"] = (
-                result["voltage_l1"] + result["voltage_l2"] + result["voltage_l3"]
-            ) / 3.0
-
-        # --- CP signal levels ---
-        for label, url, key in (
-            ("cp_level_max", cp_max_url, "cp_level_max"),
-            ("cp_level_min", cp_min_url, "cp_level_min"),
-        ):
+    def _make_text_fetch(label, url):
+        """Fetch a single string value (firmware, IDs, interface) into out[label]."""
+        async def _fetch(out, timeout):
             try:
-                async with asyncio.timeout(10):
-                    async with session.get(url, auth=aiohttp.BasicAuth(username, password)) as resp:
-                        if resp.status == 200:
-                            try:
-                                raw = await resp.json(content_type=None)
-                            except Exception:
-                                _LOGGER.debug("%s JSON decode failed", label)
-                                continue
-                            val = _extract_simple(raw)
-                            try:
-                                result[key] = float(val)
-                            except (ValueError, TypeError):
-                                _LOGGER.debug("%s unexpected value: %r", label, val)
-                        else:
-                            _LOGGER.debug("%s endpoint status %s", label, resp.status)
+                status, body = await _request(label, url, timeout)
+                if status != 200:
+                    _LOGGER.debug("%s endpoint status %s", label, status)
+                    return
+                try:
+                    raw = _decode(label, body)
+                except ValueError:
+                    raw = _text(body)
+                val = _extract_simple(raw)
+                _LOGGER.debug("%s=%r (raw=%r)", label, val, raw)
+                if val is not None:
+                    out[label] = str(val)
             except Exception as e:
                 _LOGGER.debug("%s fetch failed: %s", label, e)
+        return _fetch
 
-        # --- Derived IEC 61851 CP state ---
-        if "cp_level_max" in result:
-            v = result["cp_level_max"]
-            if v > 10.5:
-                result["cp_state"] = "No vehicle connected"
-            elif v > 7.5:
-                result["cp_state"] = "Vehicle connected"
-            elif v > 4.5:
-                result["cp_state"] = "Charging"
-            elif v > 1.5:
-                result["cp_state"] = "Charging (ventilation required)"
-            elif v > -1.5:
-                result["cp_state"] = "No power"
-            else:
-                result["cp_state"] = "Fault"
-
-        # --- Charging state ---
+    async def _fetch_connection_status(out, timeout):
         try:
-            async with asyncio.timeout(10):
-                async with session.get(charging_state_url, auth=aiohttp.BasicAuth(username, password)) as resp:
-                    if resp.status == 200:
+            status, body = await _request("connection_status", connection_status_url, timeout)
+            if status != 200:
+                _LOGGER.debug("connection_status endpoint status %s", status)
+                return
+            try:
+                raw = _decode("connection_status", body)
+            except ValueError:
+                _LOGGER.debug("connection_status JSON decode failed")
+                return
+            _LOGGER.debug("connection_status raw=%r", raw)
+            if isinstance(raw, dict):
+                for key in ("ip_address", "ip", "address", "ipv4"):
+                    if key in raw:
+                        out["ip_address"] = str(raw[key])
+                        break
+                for key in ("ssid", "SSID", "wifi_ssid"):
+                    if key in raw:
+                        out["wifi_ssid"] = str(raw[key])
+                        break
+                for key in ("rssi", "RSSI", "signal", "signal_strength", "signal_level"):
+                    if key in raw:
                         try:
-                            raw = await resp.json(content_type=None)
-                        except Exception:
-                            raw = await resp.text()
-                        val = _extract_simple(raw)
-                        if val is not None:
-                            result["charging_state"] = str(val)
-                            _LOGGER.debug("charging_state=%s (raw=%r)", val, raw)
-                    else:
-                        _LOGGER.debug("charging_state endpoint status %s", resp.status)
+                            out["wifi_signal"] = float(raw[key])
+                        except (ValueError, TypeError):
+                            pass
+                        break
         except Exception as e:
-            _LOGGER.debug("charging_state fetch failed: %s", e)
+            _LOGGER.debug("connection_status fetch failed: %s", e)
 
-        # --- PP level (Proximity Pilot — cable connection/type) ---
+    async def _fetch_sim_info(out, timeout):
         try:
-            async with asyncio.timeout(10):
-                async with session.get(pp_level_url, auth=aiohttp.BasicAuth(username, password)) as resp:
-                    if resp.status == 200:
-                        try:
-                            raw = await resp.json(content_type=None)
-                        except Exception:
-                            _LOGGER.debug("pp_level JSON decode failed")
-                        else:
-                            val = _extract_simple(raw)
-                            _LOGGER.debug("pp_level=%r (raw=%r)", val, raw)
-                            try:
-                                result["pp_level"] = float(val)
-                            except (ValueError, TypeError):
-                                _LOGGER.debug("pp_level unexpected value: %r", val)
-                    else:
-                        _LOGGER.debug("pp_level endpoint status %s", resp.status)
+            status, body = await _request("sim_info", sim_info_url, timeout)
+            if status != 200:
+                _LOGGER.debug("sim_info endpoint status %s", status)
+                return
+            try:
+                raw = _decode("sim_info", body)
+            except ValueError:
+                _LOGGER.debug("sim_info JSON decode failed")
+                return
+            _LOGGER.debug("sim_info raw=%r", raw)
+            if isinstance(raw, dict):
+                for k in ("iccid", "ICCID"):
+                    if k in raw:
+                        out["sim_iccid"] = str(raw[k])
+                        break
+                for k in ("operator", "carrier", "network", "plmn"):
+                    if k in raw:
+                        out["sim_operator"] = str(raw[k])
+                        break
+        except Exception as e:
+            _LOGGER.debug("sim_info fetch failed: %s", e)
+
+    async def _fetch_plc_status(out, timeout):
+        try:
+            status, body = await _request("plc_status", plc_status_url, timeout)
+            if status != 200:
+                _LOGGER.debug("plc_device_status endpoint status %s", status)
+                return
+            try:
+                raw = _decode("plc_status", body)
+            except ValueError:
+                _LOGGER.debug("plc_device_status JSON decode failed")
+                return
+            _LOGGER.debug("plc_device_status raw=%r", raw)
+            if isinstance(raw, dict):
+                if "firmware_version" in raw:
+                    out["plc_firmware_version"] = str(raw["firmware_version"])
+                if "zero_cross" in raw:
+                    out["plc_zero_cross"] = str(raw["zero_cross"])
         except Exception as e:
-            _LOGGER.debug("pp_level fetch failed: %s", e)
+            _LOGGER.debug("plc_device_status fetch failed: %s", e)
+
+    # (name, priority, timeout, fetch, keys it produces) — lower priority runs first.
+    # Fast fetches run every tick; if one is skipped its last value is carried
+    # forward. Slow fetches stay pending until they get a slot.
+    fast_fetches = (
+        ("energy", PRIORITY_ENERGY, 15, _fetch_energy, ENERGY_METER_KEYS),
+        ("charging_state", PRIORITY_CHARGING_STATE, 10, _fetch_charging_state, ("charging_state",)),
+        ("cp_level_max", PRIORITY_PILOT, 10, _make_level_fetch("cp_level_max", cp_max_url), ("cp_level_max",)),
+        ("cp_level_min", PRIORITY_PILOT, 10, _make_level_fetch("cp_level_min", cp_min_url), ("cp_level_min",)),
+        ("pp_level", PRIORITY_PILOT, 10, _make_level_fetch("pp_level", pp_level_url), ("pp_level",)),
+    )
+    slow_fetches = {
+        "temperatures": (PRIORITY_DIAGNOSTICS, 10, _fetch_temperatures),
+        "firmware_version": (PRIORITY_DIAGNOSTICS, 10, _make_text_fetch("firmware_version", firmware_url)),
+        "device_id": (PRIORITY_DIAGNOSTICS, 10, _make_text_fetch("device_id", device_id_url)),
+        "unit_id": (PRIORITY_DIAGNOSTICS, 10, _make_text_fetch("unit_id", unit_id_url)),
+        "network_interface": (PRIORITY_DIAGNOSTICS, 10, _make_text_fetch("network_interface", network_interface_url)),
+        "connection_status": (PRIORITY_DIAGNOSTICS, 10, _fetch_connection_status),
+        "sim_info": (PRIORITY_DIAGNOSTICS, 10, _fetch_sim_info),
+        "plc_status": (PRIORITY_DIAGNOSTICS, 10, _fetch_plc_status),
+    }
 
-        return result
+    async def _async_update_data():
+        loop = hass.loop
+        started = loop.time()
+        deadline = started + tick_budget
+        prof = _prof[0] = data.get("profiler") or NULL_PROFILER
+        prof.begin_tick()
+        try:
+            _slow_counter[0] += 1
+            if _slow_counter[0] >= _slow_modulo:
+                _slow_counter[0] = 0
+                _LOGGER.debug("Running slow fetch (every %d ticks)", _slow_modulo)
+                for name in slow_fetches:
+                    if name not in _slow_pending:
+                        _slow_pending.append(name)
+
+            result = {}
+            prev = coordinator.data
+
+            schedule = [(prio, name, timeout, fetch, result, keys) for name, prio, timeout, fetch, keys in fast_fetches]
+            schedule += [
+                (slow_fetches[name][0], name, slow_fetches[name][1], slow_fetches[name][2], _slow_cache, None)
+                for name in _slow_pending
+            ]
+            schedule.sort(key=lambda item: (item[0], -_carried.get(item[1], 0)))
+
+            deferred = []
+            slow_ran = False
+            reserve_used = False
+            for prio, name, timeout, fetch, out, keys in schedule:
+                remaining = deadline - loop.time()
+                if (
+                    keys is None and not reserve_used
+                    and remaining < TICK_MIN_FETCH_TIME
+                    and _carried.get(name, 0) >= TICK_DIAG_STARVE_TICKS
+                    and remaining + tick_reserve >= TICK_MIN_FETCH_TIME
+                ):
+                    reserve_used = True
+                    remaining += tick_reserve
+                if prio > PRIORITY_ENERGY and remaining < TICK_MIN_FETCH_TIME:
+                    deferred.append(name)
+                    age = _carried[name] = _carried.get(name, 0) + 1
+                    # Keep the last fast value for a few ticks, then drop it
+                    # rather than report a stale reading as current.
+                    if keys is not None and prev is not None and age <= TICK_MAX_CARRY_TICKS:
+                        for key in keys:
+                            if key in prev.fast:
+                                result[key] = prev.fast[key]
+                    continue
+                _carried.pop(name, None)
+                timeout = max(TICK_MIN_FETCH_TIME, min(timeout, remaining))
+                if prof.enabled:
+                    await prof.timed_fetch(name, fetch, out, timeout)
+                else:
+                    await fetch(out, timeout)
+                if keys is None:
+                    _slow_pending.remove(name)
+                    slow_ran = True
+
+            if slow_ran and _slow_cache != _slow_section[0]:
+                _slow_section[0] = MappingProxyType(dict(_slow_cache))
+                _slow_generation[0] += 1
+
+            elapsed = loop.time() - started
+            tick_stats["ticks"] += 1
+            tick_stats["last_duration"] = round(elapsed, 3)
+            tick_stats["last_deferred"] = deferred
+            tick_stats["deferred"] += len(deferred)
+            if elapsed > tick_budget:
+                tick_stats["overruns"] += 1
+                _LOGGER.warning(
+                    "Tick took %.1fs, over its %.1fs budget (scan interval %ds)",
+                    elapsed, tick_budget, scan_interval,
+                )
+            if deferred:
+                _LOGGER.debug("Tick budget exhausted, deferred: %s", ", ".join(deferred))
+
+            return GaroSnapshot(
+                MappingProxyType(result),
+                _slow_section[0],
+                prev.fast_generation + 1 if prev is not None else 1,
+                _slow_generation[0],
+            )
+        finally:
+            # Also on cancellation, so a profile never waits on a tick that
+            # will not finish.
+            prof.end_tick()
 
     coordinator = DataUpdateCoordinator(
         hass,
@@ -432,6 +532,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     data["coordinator"] = coordinator
     await coordinator.async_config_entry_first_refresh()
 
+    site = await async_get_site_aggregator(hass)
+    site.async_update_entry(entry.entry_id, coordinator.data)
+    entry.async_on_unload(coordinator.async_add_listener(
+        lambda: site.async_update_entry(entry.entry_id, coordinator.data)
+    ))
+    entry.async_on_unload(lambda: site.async_remove_entry(entry.entry_id))
+
+    fanout = async_get_readings_fanout(hass, entry.entry_id)
+    fanout.async_attach(coordinator)
+    entry.async_on_unload(fanout.async_detach)
+
     enable_phase = entry.options.get(CONF_ENABLE_PHASE_SENSORS, entry.data.get(CONF_ENABLE_PHASE_SENSORS, True))
     enable_line = entry.options.get(CONF_ENABLE_LINE_VOLTAGES, entry.data.get(CONF_ENABLE_LINE_VOLTAGES, False))
 
@@ -451,8 +562,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         wanted += ["voltage_l1_l2","voltage_l2_l3","voltage_l3_l1"]
 
     entities = [GaroChargerMeterSensor(coordinator, entry, host, k) for k in wanted if k in SENSOR_MAP]
+
     async_add_entities(entities)
 
+    # Site totals exist once, on whichever loaded entry currently owns them.
+    site.async_register_platform(
+        entry.entry_id, async_add_entities,
+        lambda: [GaroSiteSensor(site, k) for k in SITE_SENSOR_MAP],
+    )
+    entry.async_on_unload(lambda: site.async_unregister_platform(entry.entry_id))
+
 class GaroChargerMeterSensor(CoordinatorEntity, SensorEntity):
     _attr_has_entity_name = True
     def __init__(self, coordinator, entry, host, key):
@@ -477,7 +596,7 @@ class GaroChargerMeterSensor(CoordinatorEntity, SensorEntity):
     def device_info(self):
         data = self.coordinator.hass.data[DOMAIN][self._entry.entry_id]
         scheme = "http" if data.get("use_http") else "https"
-        coord_data = self.coordinator.data or {}
+        coord_data = self.coordinator.data if self.coordinator.data is not None else EMPTY_SECTION
         fw = coord_data.get("firmware_version")
         device_id = coord_data.get("device_id")
         unit_id = coord_data.get("unit_id")
@@ -499,3 +618,34 @@ class GaroChargerMeterSensor(CoordinatorEntity, SensorEntity):
             sw_version=fw,
             configuration_url=f"{scheme}://{self._host}"
         )
+
+class GaroSiteSensor(SensorEntity):
+    """Sum across all GARO chargers, pushed by the SiteAggregator."""
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, site, key):
+        self._site = site
+        self._key = key
+        info = SITE_SENSOR_MAP[key]
+        self._attr_name = info["name"]
+        self._attr_unique_id = f"{DOMAIN}_site_{key}"
+        self._attr_device_class = info.get("device_class")
+        self._attr_native_unit_of_measurement = info.get("unit")
+        self._attr_state_class = info.get("state_class")
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, "site")},
+            manufacturer=MANUFACTURER,
+            name=SITE_DEVICE_NAME,
+            model="Site total",
+        )
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        self._attr_native_value = self._site.value(self._key)
+        self.async_on_remove(self._site.async_add_listener(self._handle_site_update))
+
+    @callback
+    def _handle_site_update(self):
+        self._attr_native_value = self._site.value(self._key)
+        self.async_write_ha_state()
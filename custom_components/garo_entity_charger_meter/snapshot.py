@@ -0,0 +1,117 @@
+"""Immutable per-tick view of a charger's readings."""
+from __future__ import annotations
+from collections.abc import Mapping
+from types import MappingProxyType
+
+EMPTY_SECTION: Mapping = MappingProxyType({})
+
+
+def _current_total(snap):
+    try:
+        return snap["current_l1"] + snap["current_l2"] + snap["current_l3"]
+    except KeyError:
+        return None
+
+
+def _voltage_avg(snap):
+    try:
+        return (snap["voltage_l1"] + snap["voltage_l2"] + snap["voltage_l3"]) / 3.0
+    except KeyError:
+        return None
+
+
+def _cp_state(snap):
+    """IEC 61851 state derived from the CP max level."""
+    v = snap.fast.get("cp_level_max")
+    if v is None:
+        return None
+    if v > 10.5:
+        return "No vehicle connected"
+    if v > 7.5:
+        return "Vehicle connected"
+    if v > 4.5:
+        return "Charging"
+    if v > 1.5:
+        return "Charging (ventilation required)"
+    if v > -1.5:
+        return "No power"
+    return "Fault"
+
+
+# key -> (slot caching it on the snapshot, function computing it)
+DERIVED = {
+    "current_total": ("_current_total", _current_total),
+    "voltage_avg": ("_voltage_avg", _voltage_avg),
+    "cp_state": ("_cp_state", _cp_state),
+}
+
+# Marks a derived slot that has not been computed yet (None means "absent").
+_UNSET = object()
+
+
+class GaroSnapshot(Mapping):
+    """Coordinator data for one tick.
+
+    ``fast`` and ``slow`` are read-only sections shared between snapshots until
+    their contents change; each carries its own generation counter. Derived
+    metrics are computed on first access and cached in their own slots, so
+    reading them allocates nothing beyond the computed value.
+    """
+
+    __slots__ = (
+        "fast", "slow", "fast_generation", "slow_generation",
+        "_current_total", "_voltage_avg", "_cp_state",
+    )
+
+    def __init__(self, fast: Mapping, slow: Mapping, fast_generation: int, slow_generation: int):
+        object.__setattr__(self, "fast", fast)
+        object.__setattr__(self, "slow", slow)
+        object.__setattr__(self, "fast_generation", fast_generation)
+        object.__setattr__(self, "slow_generation", slow_generation)
+        for slot, _derive in DERIVED.values():
+            object.__setattr__(self, slot, _UNSET)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("GaroSnapshot is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("GaroSnapshot is immutable")
+
+    def __getitem__(self, key):
+        if key in self.fast:
+            return self.fast[key]
+        if key in self.slow:
+            return self.slow[key]
+        derived = DERIVED.get(key)
+        if derived is None:
+            raise KeyError(key)
+        slot, derive = derived
+        val = getattr(self, slot)
+        if val is _UNSET:
+            val = derive(self)
+            object.__setattr__(self, slot, val)
+        if val is None:
+            raise KeyError(key)
+        return val
+
+    def __iter__(self):
+        yield from self.fast
+        for key in self.slow:
+            if key not in self.fast:
+                yield key
+        for key in DERIVED:
+            if key in self:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __bool__(self):
+        # Avoid __len__ here: it would evaluate every derived metric.
+        return bool(self.fast or self.slow)
+
+    def __repr__(self):
+        return (
+            f"GaroSnapshot(fast_generation={self.fast_generation}, "
+            f"slow_generation={self.slow_generation}, fast={dict(self.fast)!r}, slow={dict(self.slow)!r})"
+        )
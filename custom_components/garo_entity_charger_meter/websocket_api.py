@@ -0,0 +1,233 @@
+"""Websocket subscription streaming energy-meter readings as deltas.
+
+Readings pushed here never touch entity state, so they are not recorded.
+"""
+from __future__ import annotations
+import logging
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import ENERGY_METER_KEYS, WS_TYPE_SUBSCRIBE_READINGS, WS_MIN_SEND_INTERVAL, DATA_FANOUTS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    websocket_api.async_register_command(hass, ws_subscribe_readings)
+
+
+@callback
+def async_get_readings_fanout(hass: HomeAssistant, entry_id: str) -> "ReadingsFanout":
+    """Fan-out for an entry; it outlives reloads so subscriptions survive them."""
+    fanouts = hass.data.setdefault(DATA_FANOUTS, {})
+    fanout = fanouts.get(entry_id)
+    if fanout is None:
+        fanout = fanouts[entry_id] = ReadingsFanout(entry_id)
+    return fanout
+
+
+@callback
+def async_remove_readings_fanout(hass: HomeAssistant, entry_id: str) -> None:
+    fanout = hass.data.get(DATA_FANOUTS, {}).pop(entry_id, None)
+    if fanout is not None:
+        fanout.async_close()
+
+
+class _Subscriber:
+    """One websocket subscription with latest-value coalescing.
+
+    A delta arriving while the subscriber is idle is sent at once and opens a
+    send window of WS_MIN_SEND_INTERVAL. Deltas arriving inside the window are
+    merged into one pending dict per entry (newest value per field wins) and
+    sent as a single message when the window closes. A subscriber therefore
+    never has more than one message per window in flight and never more than
+    one reading per field pending, however fast the chargers update.
+
+    Home Assistant does not report when a queued websocket message has been
+    written, so the send window stands in for "previous send completed".
+    """
+
+    def __init__(self, hass: HomeAssistant, connection, msg_id: int):
+        self._hass = hass
+        self._connection = connection
+        self._msg_id = msg_id
+        self._entries: set[str] = set()
+        self._pending: dict[str, dict] = {}
+        self._generations: dict[str, int] = {}
+        self._window_handle = None
+        # Held until start() so the initial readings of every entry go out as
+        # one event after the subscription result.
+        self._started = False
+
+    @callback
+    def start(self) -> None:
+        self._started = True
+        if self._pending:
+            self._send()
+
+    @callback
+    def attach(self, entry_id: str) -> None:
+        self._entries.add(entry_id)
+
+    @callback
+    def push(self, entry_id: str, generation: int, delta: dict) -> None:
+        self._pending.setdefault(entry_id, {}).update(delta)
+        self._generations[entry_id] = generation
+        if self._started and self._window_handle is None:
+            self._send()
+
+    @callback
+    def _window_closed(self) -> None:
+        self._window_handle = None
+        if self._pending:
+            self._send()
+
+    @callback
+    def _send(self) -> None:
+        pending, self._pending = self._pending, {}
+        self._window_handle = self._hass.loop.call_later(WS_MIN_SEND_INTERVAL, self._window_closed)
+        self._connection.send_message(websocket_api.event_message(self._msg_id, {
+            entry_id: {"generation": self._generations[entry_id], "changed": delta}
+            for entry_id, delta in pending.items()
+        }))
+
+    @callback
+    def entry_removed(self, entry_id: str) -> None:
+        """Tell the client an entry is gone; end the subscription if none remain."""
+        self._entries.discard(entry_id)
+        self._pending.pop(entry_id, None)
+        self._connection.send_message(websocket_api.event_message(self._msg_id, {
+            entry_id: {"removed": True}
+        }))
+        if not self._entries:
+            self._connection.subscriptions.pop(self._msg_id, None)
+            self.close()
+
+    @callback
+    def close(self) -> None:
+        if self._window_handle is not None:
+            self._window_handle.cancel()
+            self._window_handle = None
+        self._pending.clear()
+
+
+class ReadingsFanout:
+    """Per-entry fan-out: one coordinator listener and one delta per snapshot.
+
+    The coordinator is attached on entry setup and detached on unload; the
+    subscribers stay, so a reload (e.g. an options change) resumes the stream.
+    """
+
+    def __init__(self, entry_id: str):
+        self._entry_id = entry_id
+        self.coordinator = None
+        self._subscribers: set[_Subscriber] = set()
+        self._remove_listener = None
+        self._last: dict = {}
+        self._generation = None
+
+    def _readings(self) -> dict:
+        snap = self.coordinator.data if self.coordinator is not None else None
+        if snap is None:
+            return {}
+        return {k: snap.fast[k] for k in ENERGY_METER_KEYS if k in snap.fast}
+
+    def _listen(self) -> None:
+        if self._remove_listener is None and self.coordinator is not None:
+            self._remove_listener = self.coordinator.async_add_listener(self._async_on_update)
+
+    def _unlisten(self) -> None:
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+
+    @callback
+    def async_attach(self, coordinator) -> None:
+        self._unlisten()
+        self.coordinator = coordinator
+        # Generations restart with a new coordinator; keep _last so the first
+        # update after a reload is still sent as a delta.
+        self._generation = None
+        if self._subscribers:
+            self._listen()
+            self._async_on_update()
+
+    @callback
+    def async_detach(self) -> None:
+        self._unlisten()
+        self.coordinator = None
+
+    @callback
+    def async_add_subscriber(self, sub: _Subscriber):
+        if not self._subscribers:
+            self._last = self._readings()
+            snap = self.coordinator.data if self.coordinator is not None else None
+            self._generation = snap.fast_generation if snap is not None else None
+            self._listen()
+        self._subscribers.add(sub)
+        sub.attach(self._entry_id)
+        # New subscribers start from the full current reading.
+        sub.push(self._entry_id, self._generation or 0, dict(self._last))
+
+        @callback
+        def _remove():
+            self._subscribers.discard(sub)
+            if not self._subscribers:
+                self._unlisten()
+        return _remove
+
+    @callback
+    def _async_on_update(self) -> None:
+        snap = self.coordinator.data
+        if snap is None or snap.fast_generation == self._generation:
+            return
+        current = self._readings()
+        delta = {k: v for k, v in current.items() if self._last.get(k) != v}
+        for k in self._last:
+            if k not in current:
+                delta[k] = None
+        self._last = current
+        self._generation = snap.fast_generation
+        if not delta:
+            return
+        for sub in self._subscribers:
+            sub.push(self._entry_id, self._generation, delta)
+
+    @callback
+    def async_close(self) -> None:
+        """The entry was removed: notify and drop every subscriber."""
+        self.async_detach()
+        subscribers, self._subscribers = self._subscribers, set()
+        for sub in subscribers:
+            sub.entry_removed(self._entry_id)
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): WS_TYPE_SUBSCRIBE_READINGS,
+    vol.Optional("entry_ids"): [str],
+})
+@callback
+def ws_subscribe_readings(hass: HomeAssistant, connection, msg: dict) -> None:
+    fanouts = hass.data.get(DATA_FANOUTS, {})
+    loaded = [entry_id for entry_id, fanout in fanouts.items() if fanout.coordinator is not None]
+    entry_ids = msg.get("entry_ids") or loaded
+    missing = [entry_id for entry_id in entry_ids if entry_id not in loaded]
+    if missing:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, f"Entries not loaded: {', '.join(missing)}")
+        return
+
+    sub = _Subscriber(hass, connection, msg["id"])
+    unsubs = [fanouts[entry_id].async_add_subscriber(sub) for entry_id in entry_ids]
+
+    @callback
+    def _unsubscribe():
+        for unsub in unsubs:
+            unsub()
+        sub.close()
+
+    connection.subscriptions[msg["id"]] = _unsubscribe
+    connection.send_result(msg["id"])
+    sub.start()
+    _LOGGER.debug("Readings subscription %s for %s", msg["id"], entry_ids)
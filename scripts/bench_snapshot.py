@@ -0,0 +1,87 @@
+"""Measure retained memory and allocations per charger per tick.
+
+Compares the old coordinator data (slow cache copied into a fresh dict every
+tick, derived metrics computed eagerly) with GaroSnapshot (fresh fast section,
+shared slow section, lazy derived metrics) for a fleet of chargers. The
+snapshot is measured both with its derived metrics unread and with all of
+them read once, as the default-enabled entities do.
+
+Runs without Home Assistant installed:
+
+    python scripts/bench_snapshot.py [chargers]
+"""
+from __future__ import annotations
+import importlib.util
+import os
+import sys
+import tracemalloc
+from types import MappingProxyType
+
+_SNAPSHOT = os.path.join(
+    os.path.dirname(__file__), "..", "custom_components", "garo_entity_charger_meter", "snapshot.py"
+)
+_spec = importlib.util.spec_from_file_location("garo_snapshot", _SNAPSHOT)
+snapshot = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(snapshot)
+
+SLOW = {k: "x" * 20 for k in (
+    "firmware_version", "device_id", "unit_id", "network_interface", "ip_address",
+    "wifi_ssid", "sim_iccid", "sim_operator", "plc_firmware_version", "plc_zero_cross",
+)}
+SLOW.update(cpu_temperature=41.0, board_temperature=35.0, wifi_signal=-60.0)
+
+FAST = {
+    "current_l1": 1.0, "current_l2": 2.0, "current_l3": 3.0,
+    "voltage_l1": 230.0, "voltage_l2": 231.0, "voltage_l3": 229.0,
+    "voltage_l1_l2": 400.0, "voltage_l2_l3": 400.0, "voltage_l3_l1": 400.0,
+    "energy": 1234.5, "power": 4000.0,
+    "charging_state": "B2", "cp_level_max": 9.0, "cp_level_min": -12.0, "pp_level": 1.5,
+}
+
+
+def old_tick(slow_cache):
+    result = dict(slow_cache)
+    result.update(FAST)
+    result["current_total"] = result["current_l1"] + result["current_l2"] + result["current_l3"]
+    result["voltage_avg"] = (result["voltage_l1"] + result["voltage_l2"] + result["voltage_l3"]) / 3.0
+    result["cp_state"] = "Vehicle connected"
+    return result
+
+
+def new_tick(slow_section):
+    return snapshot.GaroSnapshot(MappingProxyType(dict(FAST)), slow_section, 1, 1)
+
+
+def new_tick_read(slow_section):
+    snap = new_tick(slow_section)
+    for key in snapshot.DERIVED:
+        snap.get(key)
+    return snap
+
+
+def measure(label, tick, per_charger_state, chargers):
+    kept = []
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for state in per_charger_state:
+        kept.append(tick(state))
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    size = sum(s.size_diff for s in stats)
+    count = sum(s.count_diff for s in stats)
+    print(f"{label:>14}: {size / chargers:7.0f} B/charger/tick  {count / chargers:5.1f} allocs/charger/tick")
+
+
+def main():
+    chargers = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    print(f"{chargers} chargers")
+    # Each charger has its own slow cache / frozen slow section, built outside
+    # the measured window since it only changes on slow ticks.
+    measure("dict", old_tick, [dict(SLOW) for _ in range(chargers)], chargers)
+    measure("snapshot", new_tick, [MappingProxyType(dict(SLOW)) for _ in range(chargers)], chargers)
+    measure("snapshot+read", new_tick_read, [MappingProxyType(dict(SLOW)) for _ in range(chargers)], chargers)
+
+
+if __name__ == "__main__":
+    main()